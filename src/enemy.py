@@ -15,6 +15,10 @@ class Monster(Entity):
         self.state = 'idle' # idle, chase, attack
         self.idle_timer = 0
         self.is_attacking = False
+        self.attack_timer = 0
+        self.lunge_remaining = 0
+        self.lunge_distance = 2.0
+        self.lunge_speed = 10.0 # 2 units over a 0.2s lunge
 
         # Appearance
         self.model = 'cube'
@@ -30,7 +34,8 @@ class Monster(Entity):
             self.sound_hum = None
             self.sound_screech = None
 
-    def update(self):
+    def fixed_update(self, dt):
+        # Called at the simulation tick rate, see simulation.FixedTimestep
         dist_to_player = distance(self.position, self.player.position)
 
         # Determine State
@@ -41,7 +46,7 @@ class Monster(Entity):
                 if hit_info.hit and hit_info.entity == self.player:
                     self.start_chase()
             else:
-                self.idle_behavior()
+                self.idle_behavior(dt)
 
         elif self.state == 'chase':
             if dist_to_player > self.sight_range * 1.5:
@@ -49,19 +54,18 @@ class Monster(Entity):
                 if self.sound_hum: self.sound_hum.stop()
                 self.color = color.red # Reset color
             else:
-                self.chase_behavior(dist_to_player)
+                self.chase_behavior(dist_to_player, dt)
 
         elif self.state == 'attack':
-            # Wait for animation
-            pass
+            self.attack_behavior(dt)
 
     def start_chase(self):
         self.state = 'chase'
         if self.sound_hum: self.sound_hum.play()
         self.color = color.orange # Visual indicator
 
-    def idle_behavior(self):
-        self.idle_timer -= time.dt
+    def idle_behavior(self, dt):
+        self.idle_timer -= dt
         if self.idle_timer <= 0:
             self.idle_timer = random.uniform(2, 5)
             self.rotation_y = random.uniform(0, 360)
@@ -70,12 +74,12 @@ class Monster(Entity):
         # Simple collision check
         hit_info = raycast(self.position + Vec3(0, 0.5, 0), self.forward, distance=1.5, ignore=(self,), debug=False)
         if not hit_info.hit:
-            self.position += self.forward * 2.0 * time.dt
+            self.position += self.forward * 2.0 * dt
         else:
             self.rotation_y += 180
             self.idle_timer = 0
 
-    def chase_behavior(self, dist):
+    def chase_behavior(self, dist, dt):
         # Look at player (smoothly?)
         self.look_at_2d(self.player.position, 'y')
 
@@ -83,7 +87,7 @@ class Monster(Entity):
             # Move towards player
             # Try to move directly. If blocked, slide?
             # Basic ursina movement handles simple collisions if collider is set
-            self.position += self.forward * self.speed * time.dt
+            self.position += self.forward * self.speed * dt
         else:
             if not self.is_attacking:
                 self.start_attack()
@@ -95,12 +99,26 @@ class Monster(Entity):
         self.color = color.black # Flash black
         if self.sound_screech: self.sound_screech.play()
 
-        # Lunge
-        self.animate_position(self.position + self.forward * 2, duration=0.2, curve=curve.linear)
+        # Lunge (stepped in attack_behavior so it can't pass through walls)
+        self.lunge_remaining = self.lunge_distance
+        self.attack_timer = 1.0
 
         # Damage Player Logic would go here (e.g. self.player.take_damage())
 
-        invoke(self.reset_attack, delay=1.0)
+    def attack_behavior(self, dt):
+        if self.lunge_remaining > 0:
+            # Track distance, not time, so the lunge always ends at exactly lunge_distance
+            step = min(self.lunge_speed * dt, self.lunge_remaining)
+            hit_info = raycast(self.position + Vec3(0, 0.5, 0), self.forward, distance=step + 0.5, ignore=(self,), debug=False)
+            if hit_info.hit and hit_info.entity != self.player:
+                self.lunge_remaining = 0 # Stop at the wall
+            else:
+                self.position += self.forward * step
+                self.lunge_remaining -= step
+
+        self.attack_timer -= dt
+        if self.attack_timer <= 0:
+            self.reset_attack()
 
     def reset_attack(self):
         self.is_attacking = False
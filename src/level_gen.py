@@ -1,19 +1,32 @@
 import random
 
+import numpy as np
+
 class LevelGenerator:
-    def __init__(self, width=31, height=31):
-        # Ensure dimensions are odd for maze generation
-        self.width = width if width % 2 != 0 else width + 1
-        self.height = height if height % 2 != 0 else height + 1
+    def __init__(self, width=31, height=31, mode="maze", fill_ratio=0.45, smooth_steps=5, seed=None):
+        if mode == "maze":
+            # Ensure dimensions are odd for maze generation
+            width = width if width % 2 != 0 else width + 1
+            height = height if height % 2 != 0 else height + 1
+        self.width = width
+        self.height = height
+        self.mode = mode
         self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
         self.player_start = (1, 1)
         self.enemy_spawns = []
         self.key_spawns = []
         self.exit_pos = None
 
+        # Cave settings (cellular automata)
+        self.fill_ratio = fill_ratio
+        self.smooth_steps = smooth_steps
+
+        # Same seed gives the same level, in either mode
+        self.seed = seed
+
     def generate(self):
         """
-        Generates a maze using recursive backtracking.
+        Generates a level using the configured mode ("maze" or "cave").
         0 = Wall
         1 = Floor
         2 = Player Start
@@ -21,6 +34,22 @@ class LevelGenerator:
         4 = Key
         5 = Exit
         """
+        self.enemy_spawns = []
+        self.key_spawns = []
+
+        if self.mode == "maze":
+            return self.generate_maze()
+        if self.mode == "cave":
+            return self.generate_cave()
+        raise ValueError(f"Unknown level mode: {self.mode}")
+
+    def generate_maze(self):
+        """
+        Generates a maze using recursive backtracking.
+        """
+        rng = random.Random(self.seed)
+        self.player_start = (1, 1)
+
         # Start with all walls
         self.grid = [[0 for _ in range(self.width)] for _ in range(self.height)]
 
@@ -42,7 +71,7 @@ class LevelGenerator:
                         neighbors.append((nx, ny, dx, dy))
 
             if neighbors:
-                nx, ny, dx, dy = random.choice(neighbors)
+                nx, ny, dx, dy = rng.choice(neighbors)
                 # Carve path to neighbor (remove wall between)
                 self.grid[y + dy // 2][x + dx // 2] = 1
                 self.grid[ny][nx] = 1
@@ -69,7 +98,7 @@ class LevelGenerator:
         for _ in range(3):
             if not floor_tiles: break
             # Pick random far from start and other keys
-            best_k = max(random.sample(floor_tiles, min(10, len(floor_tiles))),
+            best_k = max(rng.sample(floor_tiles, min(10, len(floor_tiles))),
                          key=lambda p: abs(p[0]-start_x) + abs(p[1]-start_y))
             self.grid[best_k[1]][best_k[0]] = 4
             self.key_spawns.append(best_k)
@@ -78,7 +107,7 @@ class LevelGenerator:
         # Place Enemies
         for _ in range(5): # Increase enemy count
             if not floor_tiles: break
-            spawn = random.choice(floor_tiles)
+            spawn = rng.choice(floor_tiles)
             if abs(spawn[0]-start_x) + abs(spawn[1]-start_y) > 5: # Don't spawn on player
                 self.grid[spawn[1]][spawn[0]] = 3
                 self.enemy_spawns.append(spawn)
@@ -86,6 +115,126 @@ class LevelGenerator:
 
         return self.grid
 
+    def generate_cave(self):
+        """
+        Generates a cave using cellular automata on a NumPy grid.
+        Smoothing is done with vectorized neighbour counts, then every
+        region not connected to the largest cave is filled back in.
+        """
+        rng = np.random.default_rng(self.seed)
+        h, w = self.height, self.width
+
+        # Random noise, walls are True. Border is always wall.
+        walls = rng.random((h, w)) < self.fill_ratio
+        walls[0, :] = walls[-1, :] = True
+        walls[:, 0] = walls[:, -1] = True
+
+        for _ in range(self.smooth_steps):
+            count = self._wall_neighbours(walls)
+            # 4-5 rule: become wall with 5+ wall neighbours, floor with 3 or less
+            walls = np.where(count > 4, True, np.where(count < 4, False, walls))
+            walls[0, :] = walls[-1, :] = True
+            walls[:, 0] = walls[:, -1] = True
+
+        floor = self._largest_region(~walls)
+        if not floor.any():
+            # Degenerate noise, open up a single room so placement still works
+            floor[1:-1, 1:-1] = True
+
+        cells = floor.astype(np.int8)
+        ys, xs = np.nonzero(floor)
+
+        # Place player start (floor cell closest to the top-left corner)
+        i = int(np.argmin(xs + ys))
+        start_x, start_y = int(xs[i]), int(ys[i])
+        self.player_start = (start_x, start_y)
+        cells[start_y, start_x] = 2
+        free = np.ones(len(xs), dtype=bool)
+        free[i] = False
+
+        # Place Exit (farthest from start)
+        dist = np.abs(xs - start_x) + np.abs(ys - start_y)
+        if free.any():
+            i = int(np.argmax(np.where(free, dist, -1)))
+            self.exit_pos = (int(xs[i]), int(ys[i]))
+            cells[ys[i], xs[i]] = 5
+            free[i] = False
+
+        # Place 3 Keys (spread out)
+        for _ in range(3):
+            candidates = np.flatnonzero(free)
+            if len(candidates) == 0: break
+            # Pick random far from start
+            sample = rng.choice(candidates, min(10, len(candidates)), replace=False)
+            i = int(sample[np.argmax(dist[sample])])
+            self.key_spawns.append((int(xs[i]), int(ys[i])))
+            cells[ys[i], xs[i]] = 4
+            free[i] = False
+
+        # Place Enemies
+        for _ in range(5):
+            candidates = np.flatnonzero(free)
+            if len(candidates) == 0: break
+            i = int(rng.choice(candidates))
+            if dist[i] > 5: # Don't spawn on player
+                self.enemy_spawns.append((int(xs[i]), int(ys[i])))
+                cells[ys[i], xs[i]] = 3
+                free[i] = False
+
+        self.grid = cells.tolist()
+        return self.grid
+
+    @staticmethod
+    def _wall_neighbours(walls):
+        """
+        Counts wall cells in the 8-neighbourhood of every cell.
+        Cells outside the grid count as walls.
+        """
+        padded = np.pad(walls, 1, constant_values=True).astype(np.uint8)
+        h, w = walls.shape
+        count = np.zeros((h, w), dtype=np.uint8)
+        for dy in range(3):
+            for dx in range(3):
+                if dy == 1 and dx == 1:
+                    continue
+                count += padded[dy:dy + h, dx:dx + w]
+        return count
+
+    @staticmethod
+    def _largest_region(floor):
+        """
+        Returns a mask of the largest 4-connected floor region.
+        Uses vectorized union-find: every round each edge hooks the larger
+        root onto the smaller one, then pointer jumping flattens the trees.
+        """
+        if not floor.any():
+            return floor.copy()
+
+        h, w = floor.shape
+        index = np.arange(h * w).reshape(h, w)
+        right = floor[:, :-1] & floor[:, 1:]
+        down = floor[:-1, :] & floor[1:, :]
+        a = np.concatenate((index[:, :-1][right], index[:-1, :][down]))
+        b = np.concatenate((index[:, 1:][right], index[1:, :][down]))
+
+        parent = index.ravel().copy()
+        while len(a):
+            ra, rb = parent[a], parent[b]
+            pending = ra != rb
+            a, b, ra, rb = a[pending], b[pending], ra[pending], rb[pending]
+            parent[np.maximum(ra, rb)] = np.minimum(ra, rb)
+
+            # Pointer jumping until every cell points straight at its root
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+
+        labels = parent.reshape(h, w)
+        counts = np.bincount(labels[floor])
+        return floor & (labels == int(np.argmax(counts)))
+
     def print_grid(self):
         chars = {0: '#', 1: ' ', 2: 'P', 3: 'E', 4: 'K', 5: 'X'}
         for row in self.grid:
@@ -95,3 +244,7 @@ if __name__ == "__main__":
     gen = LevelGenerator(width=31, height=31)
     grid = gen.generate()
     gen.print_grid()
+    print()
+    gen = LevelGenerator(width=61, height=31, mode="cave")
+    grid = gen.generate()
+    gen.print_grid()
@@ -8,11 +8,13 @@ try:
     from src import level_gen
     from src import player
     from src import enemy
+    from src import simulation
 except ImportError:
     import assets
     import level_gen
     import player
     import enemy
+    import simulation
 
 app = Ursina()
 
@@ -105,16 +107,28 @@ for ex, ey in generator.enemy_spawns:
     e = enemy.Monster(player=p, position=(ex*scale, 1, ey*scale))
     monsters.append(e)
 
+# Simulation (fixed tick, rendering interpolates between ticks)
+clock = simulation.FixedTimestep(tick_rate=60)
+clock.add(p, axes="xz") # y is left to gravity and the jump animation
+for m in monsters:
+    clock.add(m)
+
 # Audio
 pickup_sound = Audio('assets/pickup.wav', autoplay=False)
 
 # --- Game Logic ---
 def update():
-    global keys_collected, game_over
-
     if held_keys['escape']:
         application.quit()
 
+    if game_over:
+        return
+
+    clock.step(time.dt, on_tick=simulation_tick)
+
+def simulation_tick(dt):
+    global keys_collected, game_over
+
     if game_over:
         return
 
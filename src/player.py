@@ -44,19 +44,11 @@ class HorrorPlayer(FirstPersonController):
             print(f"Audio failed to load: {e}")
 
     def update(self):
-        super().update()
-
-        # Movement & Stamina
-        if held_keys['left shift'] and self.stamina > 0 and (held_keys['w'] or held_keys['a'] or held_keys['s'] or held_keys['d']):
-            self.speed = 8
-            self.is_sprinting = True
-            self.stamina -= self.stamina_drain * time.dt
-        else:
-            self.speed = 5
-            self.is_sprinting = False
-            self.stamina += self.stamina_regen * time.dt
-
-        self.stamina = clamp(self.stamina, 0, self.max_stamina)
+        # Per-frame: mouse look and cosmetic effects only.
+        # Movement, gravity and stamina run in fixed_update at the tick rate.
+        self.rotation_y += mouse.velocity[0] * self.mouse_sensitivity[1]
+        self.camera_pivot.rotation_x -= mouse.velocity[1] * self.mouse_sensitivity[0]
+        self.camera_pivot.rotation_x = clamp(self.camera_pivot.rotation_x, -90, 90)
 
         # Flashlight Toggle
         if held_keys['f']: # Simple toggle check, improved in input()
@@ -80,6 +72,63 @@ class HorrorPlayer(FirstPersonController):
             self.camera_pivot.y = self.default_y # lerp(self.camera_pivot.y, self.default_y, time.dt * 5)
             self.bob_timer = 0
 
+    def fixed_update(self, dt):
+        # Called at the simulation tick rate, see simulation.FixedTimestep
+        # Movement & Stamina
+        if held_keys['left shift'] and self.stamina > 0 and (held_keys['w'] or held_keys['a'] or held_keys['s'] or held_keys['d']):
+            self.speed = 8
+            self.is_sprinting = True
+            self.stamina -= self.stamina_drain * dt
+        else:
+            self.speed = 5
+            self.is_sprinting = False
+            self.stamina += self.stamina_regen * dt
+
+        self.stamina = clamp(self.stamina, 0, self.max_stamina)
+
+        self._move(dt)
+
+    def _move(self, dt):
+        # Walk and fall with an explicit dt (same rules as FirstPersonController)
+        self.direction = Vec3(
+            self.forward * (held_keys['w'] - held_keys['s'])
+            + self.right * (held_keys['d'] - held_keys['a'])
+            ).normalized()
+
+        feet_ray = raycast(self.position + Vec3(0, 0.5, 0), self.direction, traverse_target=self.traverse_target, ignore=self.ignore_list, distance=0.5, debug=False)
+        head_ray = raycast(self.position + Vec3(0, self.height - 0.1, 0), self.direction, traverse_target=self.traverse_target, ignore=self.ignore_list, distance=0.5, debug=False)
+        if not feet_ray.hit and not head_ray.hit:
+            move_amount = self.direction * self.speed * dt
+
+            # Slide along walls instead of stopping dead
+            origin = self.position + Vec3(0, 1, 0)
+            if raycast(origin, Vec3(1, 0, 0), distance=0.5, traverse_target=self.traverse_target, ignore=self.ignore_list).hit:
+                move_amount[0] = min(move_amount[0], 0)
+            if raycast(origin, Vec3(-1, 0, 0), distance=0.5, traverse_target=self.traverse_target, ignore=self.ignore_list).hit:
+                move_amount[0] = max(move_amount[0], 0)
+            if raycast(origin, Vec3(0, 0, 1), distance=0.5, traverse_target=self.traverse_target, ignore=self.ignore_list).hit:
+                move_amount[2] = min(move_amount[2], 0)
+            if raycast(origin, Vec3(0, 0, -1), distance=0.5, traverse_target=self.traverse_target, ignore=self.ignore_list).hit:
+                move_amount[2] = max(move_amount[2], 0)
+            self.position += move_amount
+
+        if self.gravity:
+            ray = raycast(self.world_position + Vec3(0, self.height, 0), self.down, traverse_target=self.traverse_target, ignore=self.ignore_list)
+
+            if ray.distance <= self.height + 0.1:
+                if not self.grounded:
+                    self.land()
+                self.grounded = True
+                # Walk up slopes, but not walls or ledges
+                if ray.world_normal.y > 0.7 and ray.world_point.y - self.world_y < 0.5:
+                    self.y = ray.world_point[1]
+                return
+            self.grounded = False
+
+            # Not on the ground and not on the way up in a jump, fall
+            self.y -= min(self.air_time, ray.distance - 0.05) * dt * 100
+            self.air_time += dt * 0.25 * self.gravity
+
     def input(self, key):
         super().input(key)
         if key == 'f':
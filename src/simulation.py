@@ -0,0 +1,65 @@
+from ursina import *
+
+class FixedTimestep:
+    def __init__(self, tick_rate=60, max_steps=5):
+        """
+        Runs game logic at a fixed rate, independent of the render frame rate.
+        Entities registered with add() get fixed_update(dt) called once per tick,
+        and their rendered position is interpolated between the last two ticks.
+        """
+        self.dt = 1 / tick_rate
+        self.max_steps = max_steps # Cap catch-up ticks after a long hitch
+        self.accumulator = 0
+        self.tick_count = 0
+        self.entities = []
+
+    def add(self, entity, axes="xyz"):
+        # Axes not listed are left to the entity (e.g. player jump tween on y)
+        entity.sim_position = Vec3(entity.position)
+        entity.prev_position = Vec3(entity.position)
+        self.entities.append((entity, axes))
+
+    def step(self, frame_dt, on_tick=None):
+        """
+        Advances the simulation by frame_dt seconds of real time.
+        on_tick(dt) is called after the entities on every tick.
+        """
+        self.accumulator += frame_dt
+        steps = min(int(self.accumulator // self.dt), self.max_steps)
+        active = [(e, axes) for e, axes in self.entities if e.enabled]
+
+        if steps:
+            # Logic runs on the simulated positions, not the interpolated ones
+            for e, axes in active:
+                self._set_axes(e, e.sim_position, axes)
+
+            for _ in range(steps):
+                # Re-check every tick, on_tick may disable an entity (e.g. player death)
+                active = [(e, axes) for e, axes in active if e.enabled]
+                for e, axes in active:
+                    e.prev_position = Vec3(e.position)
+                for e, axes in active:
+                    e.fixed_update(self.dt)
+                if on_tick:
+                    on_tick(self.dt)
+                self.tick_count += 1
+
+            self.accumulator -= steps * self.dt
+            # Drop the backlog instead of spiralling after a long stall
+            self.accumulator = min(self.accumulator, self.dt)
+
+            active = [(e, axes) for e, axes in active if e.enabled]
+            for e, axes in active:
+                e.sim_position = Vec3(e.position)
+
+        alpha = self.accumulator / self.dt
+        for e, axes in active:
+            self._set_axes(e, lerp(e.prev_position, e.sim_position, alpha), axes)
+
+    @staticmethod
+    def _set_axes(entity, position, axes):
+        for axis in axes:
+            setattr(entity, axis, getattr(position, axis))
+
+if __name__ == "__main__":
+    pass